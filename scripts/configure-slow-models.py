@@ -9,6 +9,12 @@ import os
 import sys
 from pathlib import Path
 
+try:
+    # orjson serializes/deserializes much faster than the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = Path(".cursor")
 CONFIG_FILE = CONFIG_DIR / "smart-widgets-config.json"
 
@@ -47,9 +53,11 @@ def load_config():
     """Load existing configuration or return default."""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            raw = CONFIG_FILE.read_bytes()
+            if orjson is not None:
+                return orjson.loads(raw)
+            return json.loads(raw)
+        except ValueError as e:  # covers json and orjson decode errors
             print(f"⚠️  Warning: Invalid JSON in config file: {e}")
             return SLOW_MODEL_CONFIG.copy()
     return SLOW_MODEL_CONFIG.copy()
@@ -58,28 +66,34 @@ def load_config():
 def save_config(config):
     """Save configuration to file."""
     CONFIG_DIR.mkdir(exist_ok=True)
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CONFIG_FILE, 'w') as f:
+            json.dump(config, f, indent=2)
     print(f"✅ Configuration saved to: {CONFIG_FILE}")
 
 
+# Recognised modelConfig keys and the cast applied to their values
+_MODEL_CONFIG_CASTS = {
+    "timeout": int,
+    "retryAttempts": int,
+    "modelSpeed": str,
+    "costOptimized": bool,
+    "useSlowModels": bool,
+}
+
+
 def update_model_config(config, **kwargs):
     """Update model configuration with provided parameters."""
     ilm_config = config.setdefault("smartWidgets", {}).setdefault("ilm", {})
     model_config = ilm_config.setdefault("modelConfig", {})
-    
+
     for key, value in kwargs.items():
-        if key == "timeout":
-            model_config["timeout"] = int(value)
-        elif key == "retryAttempts":
-            model_config["retryAttempts"] = int(value)
-        elif key == "modelSpeed":
-            model_config["modelSpeed"] = value
-        elif key == "costOptimized":
-            model_config["costOptimized"] = bool(value)
-        elif key == "useSlowModels":
-            model_config["useSlowModels"] = bool(value)
-    
+        cast = _MODEL_CONFIG_CASTS.get(key)
+        if cast is not None:
+            model_config[key] = cast(value)
+
     return config
 
 
@@ -93,19 +107,22 @@ def main():
     
     # Parse command line arguments
     if len(sys.argv) > 1:
-        # Custom configuration via command line
+        # Custom configuration via command line: collect all key=value pairs
+        # in one pass, then apply them with a single config update
+        overrides = {}
         for arg in sys.argv[1:]:
-            if "=" in arg:
-                key, value = arg.split("=", 1)
-                update_model_config(config, **{key: value})
+            key, sep, value = arg.partition("=")
+            if sep:
+                overrides[key] = value
+        if overrides:
+            update_model_config(config, **overrides)
     else:
         # Use default slow model configuration
         config = SLOW_MODEL_CONFIG.copy()
     
     # Ensure Ilm is enabled
-    config.setdefault("smartWidgets", {}).setdefault("ilm", {})["enabled"] = True
-    config.setdefault("smartWidgets", {}).setdefault("ilm", {})["available"] = True
-    config.setdefault("smartWidgets", {}).setdefault("ilm", {})["modelType"] = "slow"
+    ilm_config = config.setdefault("smartWidgets", {}).setdefault("ilm", {})
+    ilm_config.update({"enabled": True, "available": True, "modelType": "slow"})
     
     # Save configuration
     save_config(config)
@@ -81,7 +81,7 @@ class TickerBase:
                 ticker = base_symbol
 
         self.ticker = ticker.upper()
-        self.session = session or requests.Session(impersonate="chrome")
+        self.session = session
         self._tz = None
 
         self._isin = None
@@ -544,11 +544,21 @@ class TickerBase:
 
         q = ticker
 
-        if self._quote.info is None:
-            # Don't print error message cause self._quote.info will print one
-            return None
-        if "shortName" in self._quote.info:
-            q = self._quote.info['shortName']
+        if self._quote._info is not None:
+            # Full info already in memory, reuse it
+            if "shortName" in self._quote._info:
+                q = self._quote._info['shortName']
+        else:
+            # Only the company name is needed here, which the lightweight
+            # quote endpoint provides without the cost of a full .info fetch.
+            result = self._quote._fetch_additional_info()
+            if result is None:
+                # Don't print error message cause fetch already logged one
+                return None
+            try:
+                q = result["quoteResponse"]["result"][0].get("shortName") or q
+            except (TypeError, KeyError, IndexError):
+                pass
 
         url = f'https://markets.businessinsider.com/ajax/SearchController_Suggest?max_results=25&query={urlencode(q)}'
         data = self._data.cache_get(url=url).text
@@ -705,7 +715,13 @@ class TickerBase:
             dts = dt_parts[0]
             tzs = dt_parts[1]
             df['Earnings Date'] = pd.to_datetime(dts, format='%B %d, %Y at %I %p')
-            df['Earnings Date'] = pd.Series([dt.tz_localize(tz) for dt, tz in zip(df['Earnings Date'], tzs)])
+            # In practice all rows share one timezone, so localize the whole
+            # column in one vectorized call; keep per-row fallback just in case.
+            unique_tzs = tzs.dropna().unique()
+            if len(unique_tzs) == 1:
+                df['Earnings Date'] = df['Earnings Date'].dt.tz_localize(unique_tzs[0])
+            else:
+                df['Earnings Date'] = pd.Series([dt.tz_localize(tz) for dt, tz in zip(df['Earnings Date'], tzs)], index=df.index)
             df = df.set_index("Earnings Date")
 
         else:
@@ -192,7 +192,7 @@ class Calendars:
         """
 
         self._logger = get_yf_logger()
-        self.session = session or Session()
+        self.session = session
         self._data: YfData = YfData(session=session)
 
         _start = self._parse_date_param(start)
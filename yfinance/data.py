@@ -29,6 +29,7 @@ def _is_transient_error(exception):
     return error_type_name in transient_error_types
 
 cache_maxsize = 64
+cache_ttl = 3600  # seconds a cache_get() response stays fresh
 
 
 def lru_cache_freezeargs(func):
@@ -454,8 +455,22 @@ class YfData(metaclass=SingletonMeta):
 
     @lru_cache_freezeargs
     @lru_cache(maxsize=cache_maxsize)
+    def _cache_get_entry(self, url, params=None, timeout=30):
+        # Mutable [fetch-time, response] pair so cache_get() can refresh stale
+        # entries in-place without evicting them.
+        return [_time.monotonic(), self.get(url, params, timeout)]
+
     def cache_get(self, url, params=None, timeout=30):
-        return self.get(url, params, timeout)
+        """
+        Like get() but memoized: repeated requests for the same URL within
+        `cache_ttl` seconds are served from memory. Stale entries are
+        re-fetched on next access.
+        """
+        entry = self._cache_get_entry(url, params, timeout)
+        if cache_ttl is not None and (_time.monotonic() - entry[0]) > cache_ttl:
+            entry[1] = self.get(url, params, timeout)
+            entry[0] = _time.monotonic()
+        return entry[1]
 
     def get_raw_json(self, url, params=None, timeout=30):
         utils.get_yf_logger().debug(f'get_raw_json(): {url}')
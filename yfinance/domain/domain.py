@@ -28,6 +28,7 @@ class Domain(ABC):
 
         self._name: Optional[str] = None
         self._symbol: Optional[str] = None
+        self._ticker: Optional[Ticker] = None
         self._overview: Optional[Dict] = None
         self._top_companies: Optional[_pd.DataFrame] = None
         self._research_reports: Optional[List[Dict[str, str]]] = None
@@ -73,7 +74,9 @@ class Domain(ABC):
             Ticker: A Ticker object associated with the domain entity.
         """
         self._ensure_fetched(self._symbol)
-        return Ticker(self._symbol)
+        if self._ticker is None:
+            self._ticker = Ticker(self._symbol)
+        return self._ticker
 
     @property
     def overview(self) -> Dict:
@@ -57,8 +57,13 @@ class Market:
             "market": self.market
         }
 
-        self._summary = self._fetch_json(summary_url, summary_params)
-        self._status = self._fetch_json(status_url, status_params)
+        # Fetch concurrently: overlaps the two request latencies, and keeps
+        # the summary & status readings closer together in time.
+        pool = utils.get_thread_pool()
+        summary_future = pool.submit(self._fetch_json, summary_url, summary_params)
+        status_future = pool.submit(self._fetch_json, status_url, status_params)
+        self._summary = summary_future.result()
+        self._status = status_future.result()
 
         try:
             self._summary = self._summary['marketSummaryResponse']['result']
@@ -28,9 +28,9 @@ from typing import Union
 
 import multitasking as _multitasking
 import pandas as _pd
-from curl_cffi import requests
 
 from . import Ticker, utils
+from . import cache
 from .data import YfData
 from . import shared
 from .config import YfConfig
@@ -92,9 +92,9 @@ def download(tickers, start=None, end=None, actions=False, threads=True,
             Optional. Always return a MultiIndex DataFrame? Default is True
     """
     logger = utils.get_yf_logger()
-    session = session or requests.Session(impersonate="chrome")
 
-    # Ensure data initialised with session.
+    # Ensure data initialised with session. If no session given then keep
+    # YfData's existing one, rather than discarding its warm connection pool.
     YfData(session=session)
 
     if logger.isEnabledFor(logging.DEBUG):
@@ -126,7 +126,14 @@ def download(tickers, start=None, end=None, actions=False, threads=True,
     for ticker in tickers:
         if utils.is_isin(ticker):
             isin = ticker
-            ticker = utils.get_ticker_by_isin(ticker)
+            # Resolve via the persistent ISIN cache (same as Ticker does),
+            # so repeated downloads don't redo the symbol search.
+            c = cache.get_isin_cache()
+            ticker = c.lookup(isin)
+            if not ticker:
+                ticker = utils.get_ticker_by_isin(isin)
+                if ticker:
+                    c.store(isin, ticker)
             shared._ISINS[ticker] = isin
         _tickers_.append(ticker)
 
@@ -142,30 +149,38 @@ def download(tickers, start=None, end=None, actions=False, threads=True,
     shared._ERRORS = {}
     shared._TRACEBACKS = {}
 
-    # download using threads
-    if threads:
-        if threads is True:
-            threads = min([len(tickers), _multitasking.cpu_count() * 2])
-        _multitasking.set_max_threads(threads)
-        for i, ticker in enumerate(tickers):
-            _download_one_threaded(ticker, period=period, interval=interval,
-                                   start=start, end=end, prepost=prepost,
-                                   actions=actions, auto_adjust=auto_adjust,
-                                   back_adjust=back_adjust, repair=repair, keepna=keepna,
-                                   progress=(progress and i > 0),
-                                   rounding=rounding, timeout=timeout)
-        while len(shared._DFS) < len(tickers):
-            _time.sleep(0.01)
-    # download synchronously
-    else:
-        for i, ticker in enumerate(tickers):
-            data = _download_one(ticker, period=period, interval=interval,
-                                 start=start, end=end, prepost=prepost,
-                                 actions=actions, auto_adjust=auto_adjust,
-                                 back_adjust=back_adjust, repair=repair, keepna=keepna,
-                                 rounding=rounding, timeout=timeout)
-            if progress:
-                shared._PROGRESS_BAR.animate()
+    # Exceptions must raise so each worker can record them per-ticker.
+    # Toggle the global flag once here instead of inside every worker, where
+    # the concurrent save/restore of shared config state could race.
+    backup = YfConfig.network.hide_exceptions
+    YfConfig.network.hide_exceptions = False
+    try:
+        # download using threads
+        if threads:
+            if threads is True:
+                threads = min([len(tickers), _multitasking.cpu_count() * 2])
+            _multitasking.set_max_threads(threads)
+            for i, ticker in enumerate(tickers):
+                _download_one_threaded(ticker, period=period, interval=interval,
+                                       start=start, end=end, prepost=prepost,
+                                       actions=actions, auto_adjust=auto_adjust,
+                                       back_adjust=back_adjust, repair=repair, keepna=keepna,
+                                       progress=(progress and i > 0),
+                                       rounding=rounding, timeout=timeout)
+            while len(shared._DFS) < len(tickers):
+                _time.sleep(0.01)
+        # download synchronously
+        else:
+            for i, ticker in enumerate(tickers):
+                data = _download_one(ticker, period=period, interval=interval,
+                                     start=start, end=end, prepost=prepost,
+                                     actions=actions, auto_adjust=auto_adjust,
+                                     back_adjust=back_adjust, repair=repair, keepna=keepna,
+                                     rounding=rounding, timeout=timeout)
+                if progress:
+                    shared._PROGRESS_BAR.animate()
+    finally:
+        YfConfig.network.hide_exceptions = backup
 
     if progress:
         shared._PROGRESS_BAR.completed()
@@ -268,9 +283,7 @@ def _download_one(ticker, start=None, end=None,
                   prepost=False, rounding=False,
                   keepna=False, timeout=10):
     data = None
-    
-    backup = YfConfig.network.hide_exceptions
-    YfConfig.network.hide_exceptions = False
+
     try:
         data = Ticker(ticker).history(
                 period=period, interval=interval,
@@ -279,12 +292,12 @@ def _download_one(ticker, start=None, end=None,
                 back_adjust=back_adjust, repair=repair,
                 rounding=rounding, keepna=keepna, timeout=timeout
         )
-        shared._DFS[ticker.upper()] = data
+        with shared._LOCK:
+            shared._DFS[ticker.upper()] = data
     except Exception as e:
-        shared._DFS[ticker.upper()] = utils.empty_df()
-        shared._ERRORS[ticker.upper()] = repr(e)
-        shared._TRACEBACKS[ticker.upper()] = traceback.format_exc()
-
-    YfConfig.network.hide_exceptions = backup
+        with shared._LOCK:
+            shared._DFS[ticker.upper()] = utils.empty_df()
+            shared._ERRORS[ticker.upper()] = repr(e)
+            shared._TRACEBACKS[ticker.upper()] = traceback.format_exc()
 
     return data
@@ -136,38 +136,37 @@ class Analysis:
         if self._growth_estimates is not None:
             return self._growth_estimates
 
-        if self._earnings_trend is None:
-            self._fetch_earnings_trend()
-
         try:
-            trends = self._fetch(['industryTrend', 'sectorTrend', 'indexTrend'])
-            trends = trends['quoteSummary']['result'][0]
+            if self._earnings_trend is None:
+                # 'earningsTrend' not cached yet, so collapse both fetches into
+                # a single quoteSummary request.
+                trends = self._fetch(['earningsTrend', 'industryTrend', 'sectorTrend', 'indexTrend'])
+                trends = trends['quoteSummary']['result'][0]
+                self._earnings_trend = trends.pop('earningsTrend', {}).get('trend', [])
+            else:
+                trends = self._fetch(['industryTrend', 'sectorTrend', 'indexTrend'])
+                trends = trends['quoteSummary']['result'][0]
         except (TypeError, KeyError):
             if not YfConfig.debug.hide_exceptions:
                 raise
             self._growth_estimates = pd.DataFrame()
             return self._growth_estimates
 
-        data = []
-        for item in self._earnings_trend:
-            period = item['period']
-            row = {'period': period, 'stockTrend': item.get('growth', {}).get('raw', None)}
-            data.append(row)
+        # Key rows by period so merging the trend estimates is a dict lookup,
+        # not a linear scan through a list of row-dicts per estimate.
+        data = {item['period']: {'stockTrend': item.get('growth', {}).get('raw', None)}
+                for item in self._earnings_trend}
 
         for trend_name, trend_info in trends.items():
             if trend_info.get('estimates'):
                 for estimate in trend_info['estimates']:
-                    period = estimate['period']
-                    existing_row = next((row for row in data if row['period'] == period), None)
-                    if existing_row:
-                        existing_row[trend_name] = estimate.get('growth')
-                    else:
-                        row = {'period': period, trend_name: estimate.get('growth')}
-                        data.append(row)
+                    data.setdefault(estimate['period'], {})[trend_name] = estimate.get('growth')
         if len(data) == 0:
             return pd.DataFrame()
 
-        self._growth_estimates = pd.DataFrame(data).set_index('period').dropna(how='all')
+        df = pd.DataFrame.from_dict(data, orient='index').dropna(how='all')
+        df.index.name = 'period'
+        self._growth_estimates = df
         return self._growth_estimates
 
     # modified version from quote.py
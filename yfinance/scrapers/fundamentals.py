@@ -140,17 +140,21 @@ class Financials:
                     data_unpacked[k] = x[k]
         timestamps = sorted(list(timestamps))
         dates = pd.to_datetime(timestamps, unit="s")
-        df = pd.DataFrame(columns=dates, index=list(data_unpacked.keys()))
-        for k, v in data_unpacked.items():
-            if df is None:
-                df = pd.DataFrame(columns=dates, index=[k])
-            df.loc[k] = {pd.Timestamp(x["asOfDate"]): x["reportedValue"]["raw"] for x in v}
+        # Accumulate each metric as a plain dict keyed by date, then assemble
+        # the table with one DataFrame construction instead of a .loc write
+        # (slow full-row alignment) per metric:
+        rows = {k: {pd.Timestamp(x["asOfDate"]): x["reportedValue"]["raw"] for x in v}
+                for k, v in data_unpacked.items()}
+        if not rows:
+            # Yahoo returned nothing for this ticker
+            return pd.DataFrame(columns=dates)
+        df = pd.DataFrame.from_dict(rows, orient="index")
+        df = df.reindex(index=list(data_unpacked.keys()), columns=dates)
 
         df.index = df.index.str.replace("^" + timescale, "", regex=True)
 
         # Ensure float type, not object
-        for d in df.columns:
-            df[d] = df[d].astype('float')
+        df = df.astype('float')
 
         # Reorder table to match order on Yahoo website
         df = df.reindex([k for k in keys if k in df.index])
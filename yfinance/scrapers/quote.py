@@ -26,6 +26,35 @@ _QUOTE_SUMMARY_URL_ = f"{_BASE_URL_}/v10/finance/quoteSummary"
 class FastInfo:
     # Contain small subset of info[] items that can be fetched faster elsewhere.
     # Imitates a dict.
+
+    # attrs = utils.attributes(self)
+    # self.keys = attrs.keys()
+    # utils.attributes is calling each method, bad! Have to hardcode.
+    # Key tables are identical for every instance so build once here,
+    # not in __init__, with frozensets for fast membership tests.
+    _properties = ["currency", "quote_type", "exchange", "timezone"]
+    _properties += ["shares", "market_cap"]
+    _properties += ["last_price", "previous_close", "open", "day_high", "day_low"]
+    _properties += ["regular_market_previous_close"]
+    _properties += ["last_volume"]
+    _properties += ["fifty_day_average", "two_hundred_day_average", "ten_day_average_volume", "three_month_average_volume"]
+    _properties += ["year_high", "year_low", "year_change"]
+
+    # Because released before fixing key case, need to officially support
+    # camel-case but also secretly support snake-case
+    _base_keys = [k for k in _properties if '_' not in k]
+
+    _sc_keys = [k for k in _properties if '_' in k]
+
+    _sc_to_cc_key = {k: utils.snake_case_2_camelCase(k) for k in _sc_keys}
+    _cc_to_sc_key = {v: k for k, v in _sc_to_cc_key.items()}
+
+    _public_keys = sorted(_base_keys + list(_sc_to_cc_key.values()))
+    _keys = sorted(_public_keys + _sc_keys)
+
+    _public_key_set = frozenset(_public_keys)
+    _key_set = frozenset(_keys)
+
     def __init__(self, tickerBaseObject):
         self._tkr = tickerBaseObject
 
@@ -61,29 +90,6 @@ class FastInfo:
         self._10d_avg_vol = None
         self._3mo_avg_vol = None
 
-        # attrs = utils.attributes(self)
-        # self.keys = attrs.keys()
-        # utils.attributes is calling each method, bad! Have to hardcode
-        _properties = ["currency", "quote_type", "exchange", "timezone"]
-        _properties += ["shares", "market_cap"]
-        _properties += ["last_price", "previous_close", "open", "day_high", "day_low"]
-        _properties += ["regular_market_previous_close"]
-        _properties += ["last_volume"]
-        _properties += ["fifty_day_average", "two_hundred_day_average", "ten_day_average_volume", "three_month_average_volume"]
-        _properties += ["year_high", "year_low", "year_change"]
-
-        # Because released before fixing key case, need to officially support
-        # camel-case but also secretly support snake-case
-        base_keys = [k for k in _properties if '_' not in k]
-
-        sc_keys = [k for k in _properties if '_' in k]
-
-        self._sc_to_cc_key = {k: utils.snake_case_2_camelCase(k) for k in sc_keys}
-        self._cc_to_sc_key = {v: k for k, v in self._sc_to_cc_key.items()}
-
-        self._public_keys = sorted(base_keys + list(self._sc_to_cc_key.values()))
-        self._keys = sorted(self._public_keys + sc_keys)
-
     # dict imitation:
     def keys(self):
         return self._public_keys
@@ -95,7 +101,7 @@ class FastInfo:
         return [self[k] for k in self._public_keys]
 
     def get(self, key, default=None):
-        if key in self.keys():
+        if key in self._public_key_set:
             if key in self._cc_to_sc_key:
                 key = self._cc_to_sc_key[key]
             return self[key]
@@ -104,14 +110,14 @@ class FastInfo:
     def __getitem__(self, k):
         if not isinstance(k, str):
             raise KeyError(f"key must be a string not '{type(k)}'")
-        if k not in self._keys:
+        if k not in self._key_set:
             raise KeyError(f"'{k}' not valid key. Examine 'FastInfo.keys()'")
         if k in self._cc_to_sc_key:
             k = self._cc_to_sc_key[k]
         return getattr(self, k)
 
     def __contains__(self, k):
-        return k in self.keys()
+        return k in self._public_key_set
 
     def __iter__(self):
         return iter(self.keys())
@@ -609,8 +615,13 @@ class Quote:
             return
         self._already_fetched = True
         modules = ['financialData', 'quoteType', 'defaultKeyStatistics', 'assetProfile', 'summaryDetail']
-        result = self._fetch(modules=modules)
-        additional_info = self._fetch_additional_info()
+        # The quoteSummary and quote requests are independent, so issue them
+        # concurrently - their latencies overlap instead of summing.
+        pool = utils.get_thread_pool()
+        result_future = pool.submit(self._fetch, modules=modules)
+        additional_future = pool.submit(self._fetch_additional_info)
+        result = result_future.result()
+        additional_info = additional_future.result()
         if additional_info is not None and result is not None:
             result.update(additional_info)
         else:
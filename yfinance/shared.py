@@ -19,8 +19,13 @@
 # limitations under the License.
 #
 
+import threading as _threading
+
 _DFS = {}
 _PROGRESS_BAR = None
 _ERRORS = {}
 _TRACEBACKS = {}
 _ISINS = {}
+
+# Guards writes to the dicts above from download worker threads.
+_LOCK = _threading.Lock()
@@ -21,7 +21,8 @@
 
 from __future__ import print_function
 
-from . import Ticker, multi
+from . import Ticker, multi, utils
+from .const import _QUERY1_URL_
 from .live import WebSocket
 from .data import YfData
 
@@ -88,8 +89,31 @@ class Tickers:
 
         return data
 
+    def quotes(self, batch_size=20):
+        """
+        Fetch market quotes for all symbols from Yahoo's multi-symbol quote
+        endpoint, batching up to `batch_size` symbols per request instead of
+        issuing one request per symbol.
+
+        Returns:
+            dict: symbol -> dict of quote fields
+        """
+        quotes = {}
+        for i in range(0, len(self.symbols), batch_size):
+            batch = self.symbols[i:i + batch_size]
+            params = {"symbols": ",".join(batch), "formatted": "false"}
+            result = self._data.get_raw_json(f"{_QUERY1_URL_}/v7/finance/quote?", params=params)
+            for quote in result.get("quoteResponse", {}).get("result", []):
+                quotes[quote["symbol"]] = quote
+        return quotes
+
     def news(self):
-        return {ticker: [item for item in Ticker(ticker).news] for ticker in self.symbols}
+        if not self.symbols:
+            return {}
+        # News retrieval is network-bound, so fetch the symbols concurrently
+        # instead of one-at-a-time.
+        news = utils.get_thread_pool().map(lambda ticker: self.tickers[ticker].news, self.symbols)
+        return dict(zip(self.symbols, news))
 
     def live(self, message_handler=None, verbose=True):
         self._message_handler = message_handler
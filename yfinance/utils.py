@@ -21,12 +21,14 @@
 
 from __future__ import print_function
 
+import atexit
 import datetime as _datetime
 import logging
 import re
 import re as _re
 import sys as _sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from inspect import getmembers
 from types import FunctionType
@@ -193,6 +195,24 @@ def _disable_debug_mode():
         yf_log_indented = False
 
 
+_thread_pool = None
+_thread_pool_lock = threading.Lock()
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared thread pool used to overlap blocking fetches,
+    creating it lazily on first use. Shut down automatically at exit.
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        with _thread_pool_lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yfinance")
+                atexit.register(_thread_pool.shutdown)
+    return _thread_pool
+
+
 def is_isin(string):
     return bool(_re.match("^([A-Z]{2})([A-Z0-9]{9})([0-9])$", string))
 
@@ -750,17 +770,12 @@ def safe_merge_dfs(df_main, df_sub, interval):
         indices -= 1  # Convert from [[i-1], [i]) to [[i], [i+1])
     # Numpy.searchsorted does not handle out-of-range well, so handle manually:
     if intraday:
-        for i in range(len(df_sub.index)):
-            dt = df_sub.index[i].date()
-            if dt < df_main.index[0].date() or dt >= df_main.index[-1].date() + _datetime.timedelta(days=1):
-                # Out-of-range
-                indices[i] = -1
+        sub_dates = df_sub.index.date
+        f_oor = (sub_dates < df_main.index[0].date()) | \
+                (sub_dates >= df_main.index[-1].date() + _datetime.timedelta(days=1))
     else:
-        for i in range(len(df_sub.index)):
-            dt = df_sub.index[i]
-            if dt < df_main.index[0] or dt >= df_main.index[-1] + td:
-                # Out-of-range
-                indices[i] = -1
+        f_oor = (df_sub.index < df_main.index[0]) | (df_sub.index >= df_main.index[-1] + td)
+    indices[f_oor] = -1
 
     f_outOfRange = indices == -1
     if f_outOfRange.any():
@@ -804,11 +819,8 @@ def safe_merge_dfs(df_main, df_sub, interval):
             indices = _np.searchsorted(_np.append(df_main.index, df_main.index[-1] + td), df_sub.index, side='right')
             indices -= 1  # Convert from [[i-1], [i]) to [[i], [i+1])
             # Numpy.searchsorted does not handle out-of-range well, so handle manually:
-            for i in range(len(df_sub.index)):
-                dt = df_sub.index[i]
-                if dt < df_main.index[0] or dt >= df_main.index[-1] + td:
-                    # Out-of-range
-                    indices[i] = -1
+            f_oor = (df_sub.index < df_main.index[0]) | (df_sub.index >= df_main.index[-1] + td)
+            indices[f_oor] = -1
 
     f_outOfRange = indices == -1
     if f_outOfRange.any():